@@ -15,30 +15,184 @@ License: Apache License 2.0
 """
 
 import streamlit as st
+import atexit
+import os
 import logging
+import logging.config
+import logging.handlers
 from pathlib import Path
 
 # Import configuration
 from config import APP_NAME, ICONS, APP_FOOTER, DATA_DIR
 
-# Import UI components
-from ui import (
-    render_sidebar,
-    render_profile_form,
-    render_missing_person_form,
-    render_document_generator
-)
+# Import UI components. Only the sidebar is needed on every rerun; the
+# page renderers are imported lazily on first dispatch (see _ROUTES)
+from ui import render_sidebar
+
+# Log file location, resolved once at import
+_LOG_PATH: Path = (DATA_DIR / 'app.log').resolve()
+
+
+# Declarative logging configuration: a rotating file handler fronted by a
+# memory buffer so routine INFO records batch into large writes and the
+# log file stays bounded on disk
+_LOGGING_CONFIG = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "standard": {
+            "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        },
+    },
+    "handlers": {
+        "file": {
+            "class": "logging.handlers.RotatingFileHandler",
+            "filename": str(_LOG_PATH),
+            "maxBytes": 10 * 1024 * 1024,
+            "backupCount": 10,
+            "delay": True,
+            "formatter": "standard",
+        },
+        "buffer": {
+            "class": "logging.handlers.MemoryHandler",
+            "capacity": 1024,
+            "flushLevel": logging.ERROR,
+            "target": "file",
+            "flushOnClose": True,
+        },
+        "console": {
+            "class": "logging.StreamHandler",
+            "formatter": "standard",
+        },
+    },
+    "root": {"level": "INFO", "handlers": ["buffer"]},
+}
+
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(DATA_DIR / 'app.log')
-    ]
-)
-logger = logging.getLogger(__name__)
+@st.cache_resource
+def _get_logger() -> logging.Logger:
+    """
+    Configure application logging exactly once per process.
+
+    Streamlit re-executes this module on every rerun, so configuring the
+    root logger at module level would re-open the log file and accumulate
+    duplicate handlers. Applying the declarative dictConfig inside a
+    st.cache_resource initializer is idempotent: handlers are created a
+    single time per process.
+
+    Returns:
+        Logger instance for this module
+    """
+    config = dict(_LOGGING_CONFIG)
+
+    # Console logging costs a format + stderr write per record on every
+    # rerun and is rarely visible in deployment; opt in during development
+    # by setting LD_PROFILE_CONSOLE_LOG=1
+    handlers = ["buffer"]
+    if os.environ.get("LD_PROFILE_CONSOLE_LOG") == "1":
+        handlers.append("console")
+    config["root"] = {"level": "INFO", "handlers": handlers}
+
+    logging.config.dictConfig(config)
+
+    # Make sure buffered records reach disk on interpreter shutdown
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, logging.handlers.MemoryHandler):
+            atexit.register(handler.flush)
+    return logging.getLogger(__name__)
+
+
+logger = _get_logger()
+
+# Static page title, built once at import instead of on every rerun
+_TITLE = f"{ICONS['profile']} {APP_NAME}"
+
+# Pre-formatted pieces of the top-level error message, so the exception
+# path does a single string concatenation and one st.error call
+_ERROR_PREFIX = f"{ICONS['error']} An unexpected error occurred: "
+_ERROR_SUFFIX = "\n\nPlease try refreshing the page or contact support."
+
+def _render_profile_page() -> None:
+    """Import and render the profile form on first use."""
+    from ui import render_profile_form
+    render_profile_form()
+
+
+def _render_missing_person_page() -> None:
+    """Import and render the missing person form on first use."""
+    from ui import render_missing_person_form
+    render_missing_person_form()
+
+
+def _render_documents_page() -> None:
+    """Import and render the document generator on first use."""
+    from ui import render_document_generator
+    render_document_generator()
+
+
+# Navigation dispatch table, built once at import; a dict lookup replaces
+# the per-rerun if/elif chain over the navigation labels, and each entry
+# imports its page module only when that page is first visited
+_ROUTES = {
+    "Edit Profile": _render_profile_page,
+    "Missing Person Information": _render_missing_person_page,
+    "Generate Documents": _render_documents_page,
+}
+
+# Custom CSS for better styling, defined once at module scope so the
+# literal is not rebuilt on every rerun
+_CSS = """
+<style>
+.main .block-container {
+    padding-top: 2rem;
+    padding-bottom: 2rem;
+}
+h1, h2, h3 {
+    margin-top: 1rem;
+    margin-bottom: 1rem;
+}
+.st-emotion-cache-q8sbsg p {
+    font-size: 15px !important;
+}
+/* Improve form styling */
+div[data-testid="stForm"] {
+    background-color: #f8f9fa;
+    padding: 1.5rem;
+    border-radius: 10px;
+    border: 1px solid #e9ecef;
+}
+/* Improve expandable sections */
+details {
+    background-color: #f8f9fa;
+    padding: 1rem;
+    border-radius: 5px;
+    margin-bottom: 1rem;
+}
+/* Improve button styling */
+.stButton > button {
+    font-weight: 600;
+}
+/* Add spacing between sections */
+h3 {
+    margin-top: 2rem !important;
+}
+</style>
+"""
+
+
+@st.cache_data
+def _css() -> str:
+    """
+    Return the static CSS block.
+
+    Cached so Streamlit serves the same interned string object on every
+    rerun instead of re-marshaling the literal.
+
+    Returns:
+        CSS markup string
+    """
+    return _CSS
 
 
 def main():
@@ -58,66 +212,38 @@ def main():
     Returns:
         None
     """
-    # Set page config
-    st.set_page_config(
-        page_title=APP_NAME,
-        page_icon=ICONS['profile'],
-        layout="wide",
-        initial_sidebar_state="expanded"
-    )
+    # Set page config once per session; its effect persists across reruns,
+    # so skipping it avoids rebuilding the constant argument set every time.
+    # The CSS and title below must be re-emitted each rerun — Streamlit
+    # drops elements that are not re-created — so they stay unguarded.
+    if "page_configured" not in st.session_state:
+        st.set_page_config(
+            page_title=APP_NAME,
+            page_icon=ICONS['profile'],
+            layout="wide",
+            initial_sidebar_state="expanded"
+        )
+        st.session_state["page_configured"] = True
     
     # Add custom CSS for better styling
-    st.markdown("""
-    <style>
-    .main .block-container {
-        padding-top: 2rem;
-        padding-bottom: 2rem;
-    }
-    h1, h2, h3 {
-        margin-top: 1rem;
-        margin-bottom: 1rem;
-    }
-    .st-emotion-cache-q8sbsg p {
-        font-size: 15px !important;
-    }
-    /* Improve form styling */
-    div[data-testid="stForm"] {
-        background-color: #f8f9fa;
-        padding: 1.5rem;
-        border-radius: 10px;
-        border: 1px solid #e9ecef;
-    }
-    /* Improve expandable sections */
-    details {
-        background-color: #f8f9fa;
-        padding: 1rem;
-        border-radius: 5px;
-        margin-bottom: 1rem;
-    }
-    /* Improve button styling */
-    .stButton > button {
-        font-weight: 600;
-    }
-    /* Add spacing between sections */
-    h3 {
-        margin-top: 2rem !important;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(_css(), unsafe_allow_html=True)
     
     # App title
-    st.title(f"{ICONS['profile']} {APP_NAME}")
+    st.title(_TITLE)
     
     # Render the sidebar and get the selected navigation option
     nav_option = render_sidebar()
+
+    # Persist the selection so render functions (and their caches) can tell
+    # whether a rerun was caused by an actual navigation change rather than
+    # an unrelated widget interaction
+    st.session_state["nav_changed"] = st.session_state.get("nav_option") != nav_option
+    st.session_state["nav_option"] = nav_option
     
     # Render the appropriate page based on navigation selection
-    if nav_option == "Edit Profile":
-        render_profile_form()
-    elif nav_option == "Missing Person Information":
-        render_missing_person_form()
-    elif nav_option == "Generate Documents":
-        render_document_generator()
+    handler = _ROUTES.get(nav_option)
+    if handler is not None:
+        handler()
     
     # Footer
     st.markdown("---")
@@ -128,7 +254,9 @@ if __name__ == "__main__":
     try:
         main()
     except Exception as e:
-        # Handle any unhandled exceptions
-        logger.error(f"Unhandled exception: {str(e)}", exc_info=True)
-        st.error(f"{ICONS['error']} An unexpected error occurred: {str(e)}")
-        st.error("Please try refreshing the page or contact support.")
+        # Handle any unhandled exceptions; flush any buffered log records so
+        # the context leading up to the failure reaches app.log
+        logger.error("Unhandled exception: %s", e, exc_info=True)
+        for handler in logging.getLogger().handlers:
+            handler.flush()
+        st.error(_ERROR_PREFIX + str(e) + _ERROR_SUFFIX)
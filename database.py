@@ -10,21 +10,57 @@ Author: Adam Vials Moore
 License: Apache License 2.0
 """
 
+import os
 import json
+import hashlib
 import datetime
 import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import Dict, List, Optional, Any, Union
 from pathlib import Path
 
 import sqlalchemy as sa
-from sqlalchemy import create_engine, Column, String, LargeBinary, DateTime, MetaData, Table, inspect
+from sqlalchemy import create_engine, event, text, select, bindparam, Column, String, LargeBinary, DateTime, Index, MetaData, Table, inspect
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
-from cryptography.fernet import Fernet
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import sessionmaker, scoped_session, Session
+from sqlalchemy.pool import StaticPool
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 import streamlit as st
 from config import DATABASE_URL, DATA_DIR
 
+# Try to use orjson for (de)serializing profile payloads — it is
+# several times faster than stdlib json and returns bytes directly,
+# which is what the cipher wants anyway
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional zstd compression of profile JSON before encryption: long
+# free-text fields compress well, and fewer ciphertext bytes mean
+# fewer SQLite pages written per save
+try:
+    import zstandard as zstd
+    _ZSTD_COMPRESSOR = zstd.ZstdCompressor(level=3)
+    _ZSTD_DECOMPRESSOR = zstd.ZstdDecompressor()
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Marker prepended to compressed plaintext before encryption. JSON
+# payloads always begin with '{' or '[', so the byte is unambiguous
+# and legacy rows (plain JSON) keep decoding on the old path.
+_ZSTD_FLAG = b'\x01'
+
+# Payloads smaller than this are stored uncompressed; zstd overhead
+# outweighs the savings on tiny documents
+_COMPRESS_THRESHOLD = 512
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -32,6 +68,11 @@ logger = logging.getLogger(__name__)
 # Create base class for SQLAlchemy models
 Base = declarative_base()
 
+# Database URLs whose schema has already been created/upgraded this
+# process; guards against repeating the DDL round trips if more than
+# one manager is ever constructed for the same database
+_SCHEMA_READY: set = set()
+
 
 class Profile(Base):
     """
@@ -49,6 +90,13 @@ class Profile(Base):
     created_date = Column(DateTime, default=datetime.datetime.utcnow, comment="When the profile was first created")
     last_updated = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow, 
                          comment="When the profile was last modified")
+
+    content_hash = Column(String(64), index=True,
+                          comment="blake2b digest of the plaintext profile JSON")
+
+    # Lets "recent profiles" style queries use an index range scan
+    # instead of a full table scan plus sort
+    __table_args__ = (Index("ix_profiles_last_updated", "last_updated"),)
     
     def __repr__(self):
         """String representation of Profile instance."""
@@ -65,6 +113,9 @@ class DatabaseManager:
     management, and secure storage of profile information.
     """
     
+    # Upper bound on decrypted profiles kept in memory
+    DECRYPT_CACHE_MAX = 256
+
     def __init__(self, database_url: str = DATABASE_URL, encryption_key: Optional[bytes] = None):
         """
         Initialize the database manager.
@@ -76,17 +127,31 @@ class DatabaseManager:
         self.database_url = database_url
         self._engine = None
         self._session_factory = None
+
+        # LRU cache of decrypted profiles keyed by profile_id, each
+        # entry a (last_updated, profile_data) pair so reads only pay
+        # the AES decrypt + JSON parse for rows that actually changed
+        self._decrypted_cache: "OrderedDict[str, Any]" = OrderedDict()
+
+        # Content digest of the last payload saved per profile; lets
+        # save_profile skip the encrypt + write when nothing changed
+        self._saved_digests: Dict[str, bytes] = {}
+
+        # Monotonic counter bumped on every successful write; UI layers
+        # use it to invalidate derived data (e.g. the sidebar's option
+        # lists) without re-querying on every rerun
+        self.data_version = 0
         
         # Set up encryption
         if encryption_key is None:
             # Generate a new key
-            self.encryption_key = Fernet.generate_key()
+            self.encryption_key = AESGCM.generate_key(bit_length=256)
             logger.info("Generated new encryption key")
         else:
             self.encryption_key = encryption_key
             logger.info("Using provided encryption key")
-            
-        self.cipher_suite = Fernet(self.encryption_key)
+
+        self._aead = AESGCM(self.encryption_key)
         
         # Initialize database
         self._initialize_database()
@@ -104,18 +169,88 @@ class DatabaseManager:
                 db_path = Path(self.database_url.replace('sqlite:///', ''))
                 db_dir = db_path.parent
                 db_dir.mkdir(exist_ok=True)
-                logger.info(f"Ensured database directory exists: {db_dir}")
+                logger.info("Ensured database directory exists: %s", db_dir)
             
-            # Create engine and session factory
-            self._engine = create_engine(self.database_url)
-            self._session_factory = sessionmaker(bind=self._engine)
+            # Create engine and session factory. Explicit pool sizing
+            # keeps a set of live connections instead of paying the
+            # connect handshake per CRUD call; SQLite additionally allows
+            # cross-thread use (sessions run on Streamlit script threads)
+            # and the in-memory fallback needs a single shared connection
+            # or each checkout would see an empty database.
+            if self.database_url.startswith('sqlite'):
+                engine_kwargs = {'connect_args': {'check_same_thread': False, 'timeout': 30}}
+                if ':memory:' in self.database_url:
+                    engine_kwargs['poolclass'] = StaticPool
+                else:
+                    engine_kwargs.update(pool_size=10, max_overflow=20, pool_timeout=30)
+            else:
+                engine_kwargs = {
+                    'pool_size': 10,
+                    'max_overflow': 20,
+                    'pool_timeout': 30,
+                    'pool_pre_ping': True,
+                    'pool_recycle': 1800,
+                }
+            self._engine = create_engine(self.database_url, **engine_kwargs)
+
+            # Tune SQLite for this workload: WAL lets readers proceed
+            # while a save is committing, synchronous=NORMAL halves the
+            # fsyncs per commit (still durable in WAL), and busy_timeout
+            # avoids spurious "database is locked" errors under
+            # concurrent sessions. Not applicable to in-memory databases.
+            if self.database_url.startswith('sqlite') and ':memory:' not in self.database_url:
+                @event.listens_for(self._engine, "connect")
+                def _set_sqlite_pragmas(dbapi_connection, connection_record):
+                    cursor = dbapi_connection.cursor()
+                    cursor.execute("PRAGMA journal_mode=WAL")
+                    cursor.execute("PRAGMA synchronous=NORMAL")
+                    cursor.execute("PRAGMA busy_timeout=30000")
+                    cursor.execute("PRAGMA temp_store=MEMORY")
+                    cursor.execute("PRAGMA cache_size=-20000")
+                    cursor.close()
+
+            # expire_on_commit=False keeps loaded attributes usable after
+            # commit without a refresh round-trip; the scoped registry
+            # reuses one thread-local Session per script thread instead
+            # of constructing a fresh one on every CRUD call
+            self._session_factory = scoped_session(
+                sessionmaker(bind=self._engine, expire_on_commit=False))
+
+            # Precompiled Core selects for the read paths. Reads return
+            # plain tuples, so running them on a bare connection skips
+            # Session construction and unit-of-work bookkeeping entirely;
+            # the ORM Session is kept for writes only.
+            self._ts_stmt = select(Profile.last_updated).where(
+                Profile.profile_id == bindparam('pid'))
+            self._row_stmt = select(Profile.last_updated, Profile.encrypted_data).where(
+                Profile.profile_id == bindparam('pid'))
+            self._hash_stmt = select(Profile.content_hash).where(
+                Profile.profile_id == bindparam('pid'))
+            self._list_stmt = select(Profile.profile_id, Profile.last_updated)
+            self._stale_stmt = select(Profile.profile_id, Profile.last_updated,
+                                      Profile.encrypted_data).where(
+                Profile.profile_id.in_(bindparam('pids', expanding=True)))
             
-            # Create tables if they don't exist
-            Base.metadata.create_all(self._engine)
+            # Create tables if they don't exist. create_all also builds
+            # declared indexes on fresh databases; the explicit statement
+            # covers databases created before the index existed. The
+            # whole block runs once per database URL per process.
+            if self.database_url not in _SCHEMA_READY:
+                Base.metadata.create_all(self._engine)
+                with self._engine.connect() as conn:
+                    columns = {c['name'] for c in inspect(self._engine).get_columns('profiles')}
+                    if 'content_hash' not in columns:
+                        conn.execute(text(
+                            "ALTER TABLE profiles ADD COLUMN content_hash VARCHAR(64)"))
+                    conn.execute(text(
+                        "CREATE INDEX IF NOT EXISTS ix_profiles_last_updated "
+                        "ON profiles (last_updated)"))
+                    conn.commit()
+                _SCHEMA_READY.add(self.database_url)
             
-            logger.info(f"Database initialized successfully at {self.database_url}")
+            logger.info("Database initialized successfully at %s", self.database_url)
         except Exception as e:
-            logger.error(f"Failed to initialize database: {str(e)}")
+            logger.error("Failed to initialize database: %s", e)
             raise
     
     def get_session(self) -> Session:
@@ -128,7 +263,78 @@ class DatabaseManager:
         if self._session_factory is None:
             self._initialize_database()
         return self._session_factory()
+
+    @contextmanager
+    def _session(self):
+        """
+        Scoped session for a single unit of work.
+
+        Yields the thread-local session, commits on normal exit, rolls
+        back on error, and releases the session back to the registry
+        either way — replacing the try/commit/rollback/close boilerplate
+        previously repeated in every CRUD method.
+
+        Yields:
+            A SQLAlchemy session object
+        """
+        if self._session_factory is None:
+            self._initialize_database()
+        session = self._session_factory()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            self._session_factory.remove()
     
+    # Metadata restamped on every serialization; including it in the
+    # digest would make every submit look changed
+    _VOLATILE_FIELDS = ('last_updated', 'created_date')
+
+    @staticmethod
+    def _profile_digest(data: Dict[str, Any]) -> bytes:
+        """
+        Compute a short content digest of a profile dict.
+
+        blake2b over a canonical JSON serialization; used purely for
+        change detection, so a 16-byte digest is plenty. The volatile
+        timestamp fields are excluded — to_dict restamps last_updated
+        on every call and the form rebuilds created_date per submit,
+        so hashing them would defeat the unchanged-save skip.
+
+        Args:
+            data: Dictionary containing profile data
+
+        Returns:
+            16-byte digest
+        """
+        if any(key in data for key in DatabaseManager._VOLATILE_FIELDS):
+            data = {k: v for k, v in data.items()
+                    if k not in DatabaseManager._VOLATILE_FIELDS}
+        if ORJSON_AVAILABLE:
+            canonical = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+        else:
+            canonical = json.dumps(data, sort_keys=True, separators=(',', ':')).encode()
+        return hashlib.blake2b(canonical, digest_size=16).digest()
+
+    def _cache_decrypted(self, profile_id: str, last_updated: datetime.datetime,
+                         profile_data: Dict[str, Any]) -> None:
+        """
+        Insert a decrypted profile into the LRU cache, evicting the
+        least recently used entry when over capacity.
+
+        Args:
+            profile_id: ID of the cached profile
+            last_updated: Row timestamp the payload corresponds to
+            profile_data: Decrypted profile dictionary
+        """
+        self._decrypted_cache[profile_id] = (last_updated, profile_data)
+        self._decrypted_cache.move_to_end(profile_id)
+        while len(self._decrypted_cache) > self.DECRYPT_CACHE_MAX:
+            self._decrypted_cache.popitem(last=False)
+
     def encrypt_data(self, data: Dict[str, Any]) -> bytes:
         """
         Encrypt profile data.
@@ -140,12 +346,19 @@ class DatabaseManager:
             Encrypted data as bytes
         """
         try:
-            # Convert dict to JSON string, then encrypt
-            json_data = json.dumps(data)
-            encrypted_data = self.cipher_suite.encrypt(json_data.encode())
-            return encrypted_data
+            # Convert dict to JSON, then AES-GCM encrypt with a fresh nonce.
+            # The 12-byte nonce is stored as a prefix of the ciphertext.
+            if ORJSON_AVAILABLE:
+                json_bytes = orjson.dumps(data)
+            else:
+                # Compact separators: fewer bytes to encrypt and store
+                json_bytes = json.dumps(data, separators=(',', ':')).encode()
+            if ZSTD_AVAILABLE and len(json_bytes) > _COMPRESS_THRESHOLD:
+                json_bytes = _ZSTD_FLAG + _ZSTD_COMPRESSOR.compress(json_bytes)
+            nonce = os.urandom(12)
+            return nonce + self._aead.encrypt(nonce, json_bytes, None)
         except Exception as e:
-            logger.error(f"Error encrypting data: {str(e)}")
+            logger.error("Error encrypting data: %s", e)
             raise
     
     def decrypt_data(self, encrypted_data: bytes) -> Dict[str, Any]:
@@ -159,12 +372,19 @@ class DatabaseManager:
             Dictionary containing decrypted profile data
         """
         try:
-            # Decrypt bytes, then parse JSON
-            decrypted_bytes = self.cipher_suite.decrypt(encrypted_data)
-            decrypted_json = decrypted_bytes.decode()
-            return json.loads(decrypted_json)
+            # Split off the nonce prefix through a memoryview so the
+            # (potentially large) ciphertext is not copied before the
+            # cipher reads it; only the 12-byte nonce is materialised.
+            # orjson.loads and json.loads both accept bytes directly.
+            view = memoryview(encrypted_data)
+            decrypted_bytes = self._aead.decrypt(bytes(view[:12]), view[12:], None)
+            if decrypted_bytes[:1] == _ZSTD_FLAG:
+                decrypted_bytes = _ZSTD_DECOMPRESSOR.decompress(decrypted_bytes[1:])
+            if ORJSON_AVAILABLE:
+                return orjson.loads(decrypted_bytes)
+            return json.loads(decrypted_bytes)
         except Exception as e:
-            logger.error(f"Error decrypting data: {str(e)}")
+            logger.error("Error decrypting data: %s", e)
             raise
     
     def save_profile(self, profile_data: Dict[str, Any]) -> str:
@@ -181,42 +401,87 @@ class DatabaseManager:
             Profile ID
         """
         profile_id = profile_data.get('profile_id')
+
+        # Skip the encrypt + database write entirely if the content is
+        # identical to what was last saved for this profile. The
+        # in-memory digest covers repeat saves within this process;
+        # the stored content_hash column covers the first save after a
+        # restart.
+        digest = self._profile_digest(profile_data)
+        if profile_id:
+            if self._saved_digests.get(profile_id) == digest:
+                logger.info("Profile %s unchanged, skipping save", profile_id)
+                return profile_id
+            try:
+                with self._engine.connect() as conn:
+                    stored_hash = conn.execute(
+                        self._hash_stmt, {'pid': profile_id}).scalar()
+                if stored_hash == digest.hex():
+                    self._saved_digests[profile_id] = digest
+                    logger.info("Profile %s matches stored hash, skipping save", profile_id)
+                    return profile_id
+            except Exception as e:
+                logger.warning("Could not check stored hash for %s: %s", profile_id, e)
         
         # Encrypt the profile data
         try:
             encrypted_data = self.encrypt_data(profile_data)
         except Exception as e:
-            logger.error(f"Failed to encrypt profile data: {str(e)}")
+            logger.error("Failed to encrypt profile data: %s", e)
             raise
         
         # Save to database
-        session = self.get_session()
         try:
-            # Check if profile exists
-            existing_profile = session.query(Profile).filter_by(profile_id=profile_id).first()
-            
-            if existing_profile:
-                # Update existing profile
-                existing_profile.encrypted_data = encrypted_data
-                existing_profile.last_updated = datetime.datetime.utcnow()
-                logger.info(f"Updated profile {profile_id}")
-            else:
-                # Create new profile
-                new_profile = Profile(
-                    profile_id=profile_id,
-                    encrypted_data=encrypted_data
-                )
-                session.add(new_profile)
-                logger.info(f"Created new profile {profile_id}")
-                
-            session.commit()
+            with self._session() as session:
+                now = datetime.datetime.utcnow()
+                if self._engine.dialect.name == 'sqlite':
+                    # Single INSERT ... ON CONFLICT DO UPDATE round trip
+                    # instead of a SELECT followed by an INSERT or UPDATE
+                    statement = sqlite_insert(Profile).values(
+                        profile_id=profile_id,
+                        encrypted_data=encrypted_data,
+                        content_hash=digest.hex(),
+                        created_date=now,
+                        last_updated=now,
+                    ).on_conflict_do_update(
+                        index_elements=['profile_id'],
+                        set_={'encrypted_data': encrypted_data,
+                              'content_hash': digest.hex(),
+                              'last_updated': now},
+                    )
+                    session.execute(statement)
+                    logger.info("Saved profile %s", profile_id)
+                else:
+                    # Check if profile exists
+                    existing_profile = session.query(Profile).filter_by(profile_id=profile_id).first()
+
+                    if existing_profile:
+                        # Update existing profile
+                        existing_profile.encrypted_data = encrypted_data
+                        existing_profile.content_hash = digest.hex()
+                        existing_profile.last_updated = now
+                        logger.info("Updated profile %s", profile_id)
+                    else:
+                        # Create new profile
+                        new_profile = Profile(
+                            profile_id=profile_id,
+                            encrypted_data=encrypted_data,
+                            content_hash=digest.hex()
+                        )
+                        session.add(new_profile)
+                        logger.info("Created new profile %s", profile_id)
+
+            self.data_version += 1
+            self._saved_digests[profile_id] = digest
+            # The cached copy (if any) is stale now
+            self._decrypted_cache.pop(profile_id, None)
+            # Drop any memoized copy of this profile so the next load
+            # sees the data just written
+            load_profile_cached.clear(profile_id)
             return profile_id
         except Exception as e:
-            session.rollback()
-            logger.error(f"Error saving profile: {str(e)}")
+            logger.error("Error saving profile: %s", e)
             raise
-        finally:
-            session.close()
     
     def load_profile(self, profile_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -230,27 +495,39 @@ class DatabaseManager:
         Returns:
             Dictionary containing profile data, or None if not found
         """
-        session = self.get_session()
         try:
-            # Query the profile
-            profile = session.query(Profile).filter_by(profile_id=profile_id).first()
-            if not profile:
-                logger.warning(f"Profile {profile_id} not found")
-                return None
-            
+            with self._engine.connect() as conn:
+                # Fetch just the timestamp first: if it matches the cached
+                # copy, the decrypt and full-row fetch are skipped entirely
+                last_updated = conn.execute(
+                    self._ts_stmt, {'pid': profile_id}).scalar()
+                if last_updated is None:
+                    logger.warning("Profile %s not found", profile_id)
+                    return None
+
+                cached = self._decrypted_cache.get(profile_id)
+                if cached is not None and cached[0] == last_updated:
+                    self._decrypted_cache.move_to_end(profile_id)
+                    return cached[1]
+
+                # Fetch the row
+                row = conn.execute(self._row_stmt, {'pid': profile_id}).first()
+                if row is None:
+                    logger.warning("Profile %s not found", profile_id)
+                    return None
+
             # Decrypt the profile data
             try:
-                profile_data = self.decrypt_data(profile.encrypted_data)
-                logger.info(f"Loaded profile {profile_id}")
+                profile_data = self.decrypt_data(row[1])
+                self._cache_decrypted(profile_id, row[0], profile_data)
+                logger.info("Loaded profile %s", profile_id)
                 return profile_data
             except Exception as e:
-                logger.error(f"Failed to decrypt profile {profile_id}: {str(e)}")
+                logger.error("Failed to decrypt profile %s: %s", profile_id, e)
                 return None
         except Exception as e:
-            logger.error(f"Error loading profile {profile_id}: {str(e)}")
+            logger.error("Error loading profile %s: %s", profile_id, e)
             return None
-        finally:
-            session.close()
     
     def delete_profile(self, profile_id: str) -> bool:
         """
@@ -262,24 +539,24 @@ class DatabaseManager:
         Returns:
             True if deleted successfully, False otherwise
         """
-        session = self.get_session()
         try:
-            # Find and delete the profile
-            profile = session.query(Profile).filter_by(profile_id=profile_id).first()
-            if profile:
+            with self._session() as session:
+                # Find and delete the profile
+                profile = session.query(Profile).filter_by(profile_id=profile_id).first()
+                if not profile:
+                    logger.warning("Attempted to delete non-existent profile %s", profile_id)
+                    return False
                 session.delete(profile)
-                session.commit()
-                logger.info(f"Deleted profile {profile_id}")
-                return True
-            
-            logger.warning(f"Attempted to delete non-existent profile {profile_id}")
-            return False
+
+            self.data_version += 1
+            self._saved_digests.pop(profile_id, None)
+            self._decrypted_cache.pop(profile_id, None)
+            load_profile_cached.clear(profile_id)
+            logger.info("Deleted profile %s", profile_id)
+            return True
         except Exception as e:
-            session.rollback()
-            logger.error(f"Error deleting profile {profile_id}: {str(e)}")
+            logger.error("Error deleting profile %s: %s", profile_id, e)
             return False
-        finally:
-            session.close()
     
     def get_all_profiles(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -288,25 +565,72 @@ class DatabaseManager:
         Returns:
             Dictionary mapping profile IDs to profile data
         """
-        session = self.get_session()
         try:
-            profiles = {}
-            # Query all profiles
-            for profile in session.query(Profile).all():
-                try:
-                    # Decrypt each profile
-                    profile_data = self.decrypt_data(profile.encrypted_data)
-                    profiles[profile.profile_id] = profile_data
-                except Exception as e:
-                    logger.error(f"Error decrypting profile {profile.profile_id}: {str(e)}")
-            
-            logger.info(f"Loaded {len(profiles)} profiles")
-            return profiles
+            with self._engine.connect() as conn:
+                return self._collect_profiles(conn)
         except Exception as e:
-            logger.error(f"Error getting all profiles: {str(e)}")
+            logger.error("Error getting all profiles: %s", e)
             return {}
-        finally:
-            session.close()
+
+    def _collect_profiles(self, conn) -> Dict[str, Dict[str, Any]]:
+        """
+        Gather all decrypted profiles using the given connection.
+
+        Args:
+            conn: Active SQLAlchemy Core connection
+
+        Returns:
+            Dictionary mapping profile IDs to profile data
+        """
+        profiles = {}
+        stale_ids = []
+        current_ids = set()
+
+        # Fetch only (id, last_updated) first; decryption is the
+        # expensive part, so it is done only for rows whose timestamp
+        # differs from the cached copy
+        for profile_id, last_updated in conn.execute(
+                self._list_stmt.execution_options(yield_per=256)):
+            current_ids.add(profile_id)
+            cached = self._decrypted_cache.get(profile_id)
+            if cached is not None and cached[0] == last_updated:
+                self._decrypted_cache.move_to_end(profile_id)
+                profiles[profile_id] = cached[1]
+            else:
+                stale_ids.append(profile_id)
+
+        # Decrypt only the new or changed profiles. AES-GCM releases
+        # the GIL inside OpenSSL, so a small thread pool overlaps the
+        # decrypts when several rows changed at once; a single stale
+        # row is decrypted inline to avoid the pool overhead.
+        if stale_ids:
+            rows = conn.execute(self._stale_stmt, {'pids': stale_ids}).all()
+
+            def _decrypt_row(row):
+                try:
+                    return row[0], row[1], self.decrypt_data(row[2])
+                except Exception as e:
+                    logger.error("Error decrypting profile %s: %s", row[0], e)
+                    return row[0], row[1], None
+
+            if len(rows) > 1:
+                with ThreadPoolExecutor(max_workers=min(8, len(rows))) as executor:
+                    results = list(executor.map(_decrypt_row, rows))
+            else:
+                results = [_decrypt_row(row) for row in rows]
+
+            for profile_id, last_updated, profile_data in results:
+                if profile_data is not None:
+                    self._cache_decrypted(profile_id, last_updated, profile_data)
+                    profiles[profile_id] = profile_data
+
+        # Evict cache entries for profiles deleted upstream
+        for profile_id in list(self._decrypted_cache):
+            if profile_id not in current_ids:
+                del self._decrypted_cache[profile_id]
+
+        logger.info("Loaded %s profiles (%s decrypted)", len(profiles), len(stale_ids))
+        return profiles
     
     def test_connection(self) -> bool:
         """
@@ -319,50 +643,118 @@ class DatabaseManager:
             # Check that we can connect and that the profiles table exists
             inspector = inspect(self._engine)
             tables = inspector.get_table_names()
-            logger.info(f"Database connection test successful. Tables: {tables}")
+            logger.info("Database connection test successful. Tables: %s", tables)
             return True
         except Exception as e:
-            logger.error(f"Database connection test failed: {str(e)}")
+            logger.error("Database connection test failed: %s", e)
             return False
     
     def close(self) -> None:
         """Close the database connection."""
         if self._engine:
+            # Let SQLite refresh its query-planner statistics before the
+            # connections go away
+            if self.database_url.startswith('sqlite') and ':memory:' not in self.database_url:
+                try:
+                    with self._engine.connect() as conn:
+                        conn.exec_driver_sql("PRAGMA optimize")
+                except Exception as e:
+                    logger.warning("PRAGMA optimize failed: %s", e)
             self._engine.dispose()
             logger.info("Database connection closed")
 
 
+@st.cache_resource
+def _get_encryption_key() -> bytes:
+    """
+    Get the encryption key shared by all sessions.
+
+    The key is read from the LD_PROFILE_ENCRYPTION_KEY environment
+    variable (64 hex characters for a 256-bit key). Alternatively a
+    key can be derived from LD_PROFILE_ENCRYPTION_PASSWORD and
+    LD_PROFILE_ENCRYPTION_SALT (hex) via scrypt; because this function
+    is cached with st.cache_resource, the expensive derivation runs
+    once per process rather than per session or per operation. If
+    neither is configured, a key is generated for the lifetime of the
+    process — profiles encrypted with a generated key cannot be
+    decrypted after a restart, so deployments should always set one
+    of the variables.
+
+    Returns:
+        256-bit AES key as bytes
+    """
+    key_hex = os.environ.get('LD_PROFILE_ENCRYPTION_KEY')
+    if key_hex:
+        try:
+            key = bytes.fromhex(key_hex)
+            if len(key) == 32:
+                logger.info("Using encryption key from environment")
+                return key
+            logger.error("LD_PROFILE_ENCRYPTION_KEY must be 64 hex characters, ignoring")
+        except ValueError:
+            logger.error("LD_PROFILE_ENCRYPTION_KEY is not valid hex, ignoring")
+
+    password = os.environ.get('LD_PROFILE_ENCRYPTION_PASSWORD')
+    salt_hex = os.environ.get('LD_PROFILE_ENCRYPTION_SALT')
+    if password and salt_hex:
+        try:
+            from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+            kdf = Scrypt(salt=bytes.fromhex(salt_hex), length=32, n=2**14, r=8, p=1)
+            key = kdf.derive(password.encode('utf-8'))
+            logger.info("Derived encryption key from configured password")
+            return key
+        except ValueError:
+            logger.error("LD_PROFILE_ENCRYPTION_SALT is not valid hex, ignoring")
+        except Exception as e:
+            logger.error("Failed to derive encryption key: %s", e)
+    elif password or salt_hex:
+        logger.error("Key derivation needs both LD_PROFILE_ENCRYPTION_PASSWORD "
+                     "and LD_PROFILE_ENCRYPTION_SALT, ignoring")
+
+    logger.warning("No encryption key configured; generating a process-lifetime key")
+    return AESGCM.generate_key(bit_length=256)
+
+
 # Initialize database manager
+@st.cache_resource
 def get_database_manager() -> DatabaseManager:
     """
     Get or create the database manager instance.
-    
-    This function ensures that only one database manager is created
-    per session, reusing the existing instance if available.
-    
+
+    The manager is cached with st.cache_resource so a single instance
+    (and its connection pool and cipher context) is shared across all
+    sessions, instead of each browser tab rebuilding its own.
+
     Returns:
         DatabaseManager instance
     """
-    # Use the existing manager if it exists in session state
-    if 'db_manager' not in st.session_state:
-        try:
-            # Get or create encryption key
-            if 'encryption_key' not in st.session_state:
-                st.session_state.encryption_key = Fernet.generate_key()
-                logger.info("Generated new session encryption key")
-            
-            # Create new manager with the session encryption key
-            st.session_state.db_manager = DatabaseManager(
-                database_url=DATABASE_URL,
-                encryption_key=st.session_state.encryption_key
-            )
-            logger.info("Created new database manager instance")
-        except Exception as e:
-            logger.error(f"Failed to create database manager: {str(e)}")
-            # Fall back to a basic manager that will work in memory
-            st.session_state.db_manager = DatabaseManager(
-                database_url="sqlite:///:memory:"
-            )
-            logger.warning("Using fallback in-memory database")
-    
-    return st.session_state.db_manager
+    try:
+        return DatabaseManager(
+            database_url=DATABASE_URL,
+            encryption_key=_get_encryption_key()
+        )
+    except Exception as e:
+        logger.error("Failed to create database manager: %s", e)
+        # Fall back to a basic manager that will work in memory
+        logger.warning("Using fallback in-memory database")
+        return DatabaseManager(database_url="sqlite:///:memory:")
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_profile_cached(profile_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Load a profile, memoizing the decrypted result.
+
+    Streamlit reruns the whole script on every widget interaction, and
+    the form pages each load the current profile on every rerun. Caching
+    here skips the database round-trip and AES decrypt for unchanged
+    profiles; save_profile and delete_profile invalidate the entry so
+    stale data is never served.
+
+    Args:
+        profile_id: ID of the profile to load
+
+    Returns:
+        Dictionary containing profile data, or None if not found
+    """
+    return get_database_manager().load_profile(profile_id)
@@ -16,35 +16,139 @@ Dependencies:
 - PIL/Pillow: For image handling
 """
 
-import io
 import os
+import atexit
 import logging
 import tempfile
-from typing import Dict, Any, Optional, BinaryIO, Tuple
+import threading
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 
 import streamlit as st
-from reportlab.lib.pagesizes import A4
-from reportlab.lib import colors
-from reportlab.lib.units import inch, cm
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, 
-    Image as ReportLabImage
-)
-from fpdf import FPDF
 
 from models import ProfileData
 from config import PDF_PAGE_SIZE, PDF_MARGIN
+from utils import load_image_cached
+
+# NOTE: reportlab and fpdf are imported inside the PDF functions below.
+# Loading them at module import costs interpreter startup time and memory
+# for every session, while most sessions never generate a document.
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Stable scratch paths for poster artefacts. Overwriting a file in
+# place avoids the create/unlink inode churn of a fresh
+# NamedTemporaryFile per poster; keying on the thread id keeps
+# concurrent builds (separate sessions, the generate-both thread
+# pool) from clobbering each other's files between write and embed.
+_SCRATCH_PATHS: set = set()
+
 
-def create_profile_pdf(profile_data: Dict[str, Any]) -> BinaryIO:
+def _scratch_path(kind: str, suffix: str) -> str:
+    """
+    Per-thread scratch file path for a poster artefact.
+
+    Args:
+        kind: Short artefact label (e.g. 'map', 'qr')
+        suffix: File extension including the dot
+
+    Returns:
+        Path in the temp directory, stable for this process and thread
+    """
+    path = os.path.join(
+        tempfile.gettempdir(),
+        f"ldprofile_{kind}_{os.getpid()}_{threading.get_ident()}{suffix}")
+    _SCRATCH_PATHS.add(path)
+    return path
+
+
+def _cleanup_scratch_files() -> None:
+    """Remove the scratch files created this process, ignoring missing ones."""
+    for path in _SCRATCH_PATHS:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+atexit.register(_cleanup_scratch_files)
+
+
+@lru_cache(maxsize=1)
+def _get_styles() -> Dict[str, Any]:
+    """
+    Build the shared ReportLab layout objects on first use.
+
+    The stylesheet, custom ParagraphStyles and key/value TableStyle are
+    identical for every PDF, so they are constructed once (lru_cache)
+    the first time a profile PDF is generated. Keeping the construction
+    here, rather than at module scope, means importing this module does
+    not pull in reportlab. Only read-only style objects live here —
+    flowables like Spacer mutate themselves during drawOn, so they are
+    built fresh per story.
+
+    Returns:
+        Dictionary of named styles used by create_profile_pdf
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import TableStyle
+
+    styles = getSampleStyleSheet()
+    return {
+        'heading1': ParagraphStyle(
+            'CustomHeading1',
+            parent=styles['Heading1'],
+            fontSize=18,
+            spaceAfter=12
+        ),
+        'heading2': ParagraphStyle(
+            'CustomHeading2',
+            parent=styles['Heading2'],
+            fontSize=14,
+            spaceAfter=8,
+            spaceBefore=14
+        ),
+        'normal': ParagraphStyle(
+            'CustomNormal',
+            parent=styles['Normal'],
+            fontSize=12,
+            spaceAfter=6
+        ),
+        # Key/value table styling shared by the basic-info and description
+        # tables: grey label column, white data cells, grid lines
+        'info_table': TableStyle([
+            ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
+            ('TEXTCOLOR', (0, 0), (0, -1), colors.black),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+            ('BACKGROUND', (1, 0), (1, -1), colors.white),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+        ]),
+    }
+
+
+# One-page profile and Herbert/Philomena protocol sections as
+# (heading, profile field) pairs, rendered in order by create_profile_pdf
+_PROFILE_SECTIONS = [
+    ("What's Important To Me:", 'important_to_me'),
+    ("How Best To Support Me:", 'how_to_support'),
+    ("How I Communicate:", 'communication'),
+    ("Medical Information:", 'medical_info'),
+    ("Places I Might Go:", 'places_might_go'),
+    ("Travel Patterns and Routines:", 'travel_routines'),
+]
+
+
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60)
+def create_profile_pdf(profile_data: Dict[str, Any]) -> bytes:
     """
     Create a PDF of the one-page profile based on person-centered planning approaches.
-    
+
     This function generates a comprehensive PDF document that includes:
     - Basic personal information
     - Physical description
@@ -54,21 +158,39 @@ def create_profile_pdf(profile_data: Dict[str, Any]) -> BinaryIO:
     - Medical information
     - Places the person might go
     - Travel patterns and routines
-    
+
+    Results are memoized on the profile content, so regenerating a PDF for
+    an unchanged profile returns the cached bytes instead of re-running the
+    ReportLab layout.
+
     Args:
         profile_data: Dictionary containing the person's profile information
-        
+
     Returns:
-        BytesIO object containing the PDF document, ready for downloading
-        
+        PDF document as bytes, ready for downloading
+
     Raises:
         Exception: If there's an error during PDF generation
     """
-    logger.info(f"Creating profile PDF for {profile_data.get('name', 'unknown')}")
-    
-    # Create buffer for PDF output
-    pdf_buffer = io.BytesIO()
-    
+    # Deferred imports: reportlab is only loaded the first time a PDF is
+    # actually generated (sys.modules makes repeat calls free)
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import inch
+    from reportlab.lib.utils import ImageReader
+    from reportlab.platypus import (
+        SimpleDocTemplate, Paragraph, Spacer, Table,
+        Image as ReportLabImage
+    )
+
+    logger.info("Creating profile PDF for %s", profile_data.get('name', 'unknown'))
+
+    styles = _get_styles()
+
+    # Create buffer for PDF output. SpooledTemporaryFile keeps small
+    # documents in memory but transparently spills to disk past 512 KB,
+    # so image-heavy PDFs do not pin megabytes of RAM per build
+    pdf_buffer = tempfile.SpooledTemporaryFile(max_size=512 * 1024, mode='w+b')
+
     # Create PDF document with A4 size and margins
     doc = SimpleDocTemplate(
         pdf_buffer, 
@@ -79,50 +201,40 @@ def create_profile_pdf(profile_data: Dict[str, Any]) -> BinaryIO:
         bottomMargin=PDF_MARGIN
     )
     
-    # Get base styles and create custom styles for consistent formatting
-    styles = getSampleStyleSheet()
-    
-    # Create custom heading and paragraph styles to avoid conflicts with base styles
-    heading1_style = ParagraphStyle(
-        'CustomHeading1', 
-        parent=styles['Heading1'],
-        fontSize=18, 
-        spaceAfter=12
-    )
-    
-    heading2_style = ParagraphStyle(
-        'CustomHeading2', 
-        parent=styles['Heading2'],
-        fontSize=14, 
-        spaceAfter=8, 
-        spaceBefore=14
-    )
-    
-    normal_style = ParagraphStyle(
-        'CustomNormal', 
-        parent=styles['Normal'],
-        fontSize=12, 
-        spaceAfter=6
-    )
-    
-    # Initialize the story (content elements that will be added to the PDF)
-    story = []
-    
+    def _kv_table(rows, label_w, value_w):
+        # Shared construction for the two key/value tables: fixed column
+        # widths plus the common grey-label style
+        table = Table(rows, colWidths=[label_w, value_w])
+        table.setStyle(styles['info_table'])
+        return table
+
     # === TITLE SECTION ===
+    # Initialize the story (content elements that will be added to the
+    # PDF) as one literal so the list is sized in a single allocation
     title = f"One-Page Profile: {profile_data.get('name', '')}"
-    story.append(Paragraph(title, heading1_style))
-    story.append(Spacer(1, 0.3*inch))
+    story = [
+        Paragraph(title, styles['heading1']),
+        Spacer(1, 0.3*inch),
+    ]
     
     # === PROFILE IMAGE SECTION ===
-    # Add profile image if available
+    # Add profile image if available, feeding ReportLab the memoized
+    # decoded image so repeated generations skip the disk read and
+    # decode. EAFP: attempting the load directly avoids a separate stat
+    # and the check-then-use race
     profile_image = profile_data.get('profile_image')
-    if profile_image and os.path.exists(profile_image):
+    if profile_image:
         try:
-            img = ReportLabImage(profile_image, width=2*inch, height=2*inch)
-            story.append(img)
-            story.append(Spacer(1, 0.2*inch))
+            img = ReportLabImage(
+                ImageReader(load_image_cached(profile_image)),
+                width=2*inch, height=2*inch
+            )
+            story += (img, Spacer(1, 0.2*inch))
+        except (FileNotFoundError, TypeError):
+            # Missing or unreadable image: the PDF is still valid without it
+            logger.warning("Profile image %s not available for PDF", profile_image)
         except Exception as e:
-            logger.error(f"Error adding profile image to PDF: {str(e)}")
+            logger.error("Error adding profile image to PDF: %s", e)
     
     # === BASIC INFORMATION TABLE ===
     basic_info = [
@@ -132,29 +244,7 @@ def create_profile_pdf(profile_data: Dict[str, Any]) -> BinaryIO:
         ['Emergency Contact', profile_data.get('emergency_contact', '')]
     ]
     
-    # Create a table with two columns of specific widths
-    basic_info_table = Table(basic_info, colWidths=[100, 350])
-    
-    # Style the table with grey headers and gridlines
-    basic_info_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),  # Grey background for headers
-        ('TEXTCOLOR', (0, 0), (0, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('BACKGROUND', (1, 0), (1, -1), colors.white),  # White background for data cells
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),   # Grid lines
-    ]))
-    
-    story.append(basic_info_table)
-    story.append(Spacer(1, 0.3*inch))
-    
-    # === IMPORTANT INFORMATION SECTION ===
-    story.append(Paragraph("Important Information to Keep Me Safe", heading2_style))
-    
     # --- Physical Description Table ---
-    story.append(Paragraph("Physical Description:", heading2_style))
     description_data = [
         ['Height', profile_data.get('height', '')],
         ['Build', profile_data.get('build', '')],
@@ -163,111 +253,139 @@ def create_profile_pdf(profile_data: Dict[str, Any]) -> BinaryIO:
         ['Distinguishing Features', profile_data.get('distinguishing_features', '')]
     ]
     
-    description_table = Table(description_data, colWidths=[150, 300])
-    description_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-        ('TEXTCOLOR', (0, 0), (0, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('BACKGROUND', (1, 0), (1, -1), colors.white),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-    ]))
-    
-    story.append(description_table)
-    story.append(Spacer(1, 0.2*inch))
-    
-    # === ONE-PAGE PROFILE SECTIONS ===
-    # --- What's Important To Me Section ---
-    story.append(Paragraph("What's Important To Me:", heading2_style))
-    story.append(Paragraph(profile_data.get('important_to_me', ''), normal_style))
-    story.append(Spacer(1, 0.2*inch))
-    
-    # --- How Best To Support Me Section ---
-    story.append(Paragraph("How Best To Support Me:", heading2_style))
-    story.append(Paragraph(profile_data.get('how_to_support', ''), normal_style))
-    story.append(Spacer(1, 0.2*inch))
-    
-    # --- Communication Section ---
-    story.append(Paragraph("How I Communicate:", heading2_style))
-    story.append(Paragraph(profile_data.get('communication', ''), normal_style))
-    story.append(Spacer(1, 0.2*inch))
-    
-    # === HERBERT/PHILOMENA PROTOCOL SECTIONS ===
-    # --- Medical Information Section ---
-    story.append(Paragraph("Medical Information:", heading2_style))
-    story.append(Paragraph(profile_data.get('medical_info', ''), normal_style))
-    story.append(Spacer(1, 0.2*inch))
-    
-    # --- Places I Might Go Section ---
-    story.append(Paragraph("Places I Might Go:", heading2_style))
-    story.append(Paragraph(profile_data.get('places_might_go', ''), normal_style))
-    story.append(Spacer(1, 0.2*inch))
-    
-    # --- Travel Patterns and Routines Section ---
-    story.append(Paragraph("Travel Patterns and Routines:", heading2_style))
-    story.append(Paragraph(profile_data.get('travel_routines', ''), normal_style))
+    # === BASIC INFO AND IMPORTANT INFORMATION SECTIONS ===
+    # Batched into one extend rather than append-per-flowable
+    story += (
+        _kv_table(basic_info, 100, 350),
+        Spacer(1, 0.3*inch),
+        Paragraph("Important Information to Keep Me Safe", styles['heading2']),
+        Paragraph("Physical Description:", styles['heading2']),
+        _kv_table(description_data, 150, 300),
+        Spacer(1, 0.2*inch),
+    )
     
+    # === ONE-PAGE PROFILE AND HERBERT/PHILOMENA PROTOCOL SECTIONS ===
+    # Driven by the declarative _PROFILE_SECTIONS table rather than a long
+    # run of individual append calls
+    for heading, field in _PROFILE_SECTIONS:
+        story.extend((
+            Paragraph(heading, styles['heading2']),
+            Paragraph(profile_data.get(field, ''), styles['normal']),
+            Spacer(1, 0.2*inch),
+        ))
+
     # === FOOTER SECTION ===
     # Add a footer with data protection notice
-    story.append(Spacer(1, 0.5*inch))
     footer_text = "CONFIDENTIAL - Data Protection: This document contains personal data subject to GDPR. Handle according to data protection policies."
-    story.append(Paragraph(footer_text, normal_style))
+    story += (Spacer(1, 0.5*inch), Paragraph(footer_text, styles['normal']))
     
     # Build the PDF document from the story elements
     try:
         doc.build(story)
-        logger.info(f"Profile PDF created successfully for {profile_data.get('name', 'unknown')}")
+        logger.info("Profile PDF created successfully for %s", profile_data.get('name', 'unknown'))
     except Exception as e:
-        logger.error(f"Error building profile PDF: {str(e)}")
+        logger.error("Error building profile PDF: %s", e)
         raise
-    
-    return pdf_buffer
+
+    # Read the finished document back out and release the buffer (and any
+    # spill file) immediately
+    pdf_buffer.seek(0)
+    pdf_bytes = pdf_buffer.read()
+    pdf_buffer.close()
+    return pdf_bytes
 
 
-class MissingPersonPoster(FPDF):
+@lru_cache(maxsize=128)
+def _qr_png_bytes(url: str) -> bytes:
     """
-    Custom FPDF class for creating missing person posters.
-    
-    This class extends the FPDF base class to create specialized missing person
-    posters with consistent formatting. It automatically adds a header to each
-    page with the "MISSING PERSON" title and the person's name.
+    Render a QR code for the given URL and return the PNG bytes.
+
+    QR encoding (Reed-Solomon + matrix construction) is the expensive
+    part and the same Google Maps URL recurs whenever a poster is
+    regenerated for an unchanged location, so the rendered bytes are
+    memoized per process.
+
+    Args:
+        url: URL to encode
+
+    Returns:
+        PNG image bytes for the QR code
     """
-    
-    def __init__(self, profile_data: Dict[str, Any]):
-        """
-        Initialize the missing person poster.
-        
-        Args:
-            profile_data: Dictionary containing the person's profile information
-        """
-        super().__init__()
-        self.profile_data = profile_data
-    
-    def header(self):
+    import io
+    import qrcode
+
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=10,
+        border=4,
+    )
+    qr.add_data(url)
+    qr.make(fit=True)
+    img = qr.make_image(fill_color="black", back_color="white")
+    buffer = io.BytesIO()
+    img.save(buffer)
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=1)
+def _get_poster_class():
+    """
+    Build the MissingPersonPoster class on first use.
+
+    Defining the class inside a cached factory keeps fpdf out of module
+    import; the class object itself is created once and reused.
+
+    Returns:
+        The MissingPersonPoster class (an FPDF subclass)
+    """
+    from fpdf import FPDF
+
+    class MissingPersonPoster(FPDF):
         """
-        Add a standard header to each page of the poster.
-        
-        This method is automatically called by FPDF when a new page is added.
-        It adds a "MISSING PERSON" title and a subtitle with the person's name.
+        Custom FPDF class for creating missing person posters.
+
+        This class extends the FPDF base class to create specialized missing person
+        posters with consistent formatting. It automatically adds a header to each
+        page with the "MISSING PERSON" title and the person's name.
         """
-        # Add "MISSING PERSON" title
-        self.set_font('Arial', 'B', 24)
-        self.cell(0, 15, 'MISSING PERSON', 0, 1, 'C')
-        
-        # Add the person's name as a subtitle
-        self.set_font('Arial', 'B', 16)
-        self.cell(0, 10, f"URGENT: Please help find {self.profile_data.get('name', '')}", 0, 1, 'C')
-        
-        # Add some space after the header
-        self.ln(5)
 
+        def __init__(self, profile_data: Dict[str, Any]):
+            """
+            Initialize the missing person poster.
+
+            Args:
+                profile_data: Dictionary containing the person's profile information
+            """
+            super().__init__()
+            self.profile_data = profile_data
+
+        def header(self):
+            """
+            Add a standard header to each page of the poster.
+
+            This method is automatically called by FPDF when a new page is added.
+            It adds a "MISSING PERSON" title and a subtitle with the person's name.
+            """
+            # Add "MISSING PERSON" title
+            self.set_font('Arial', 'B', 24)
+            self.cell(0, 15, 'MISSING PERSON', 0, 1, 'C')
+
+            # Add the person's name as a subtitle
+            self.set_font('Arial', 'B', 16)
+            self.cell(0, 10, f"URGENT: Please help find {self.profile_data.get('name', '')}", 0, 1, 'C')
+
+            # Add some space after the header
+            self.ln(5)
+
+    return MissingPersonPoster
 
-def create_missing_person_poster(profile_data: Dict[str, Any]) -> BinaryIO:
+
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60)
+def create_missing_person_poster(profile_data: Dict[str, Any]) -> bytes:
     """
     Create a comprehensive missing person poster PDF.
-    
+
     This function generates a multi-page PDF poster that includes:
     - The person's photo and physical description
     - When and where they were last seen
@@ -275,23 +393,23 @@ def create_missing_person_poster(profile_data: Dict[str, Any]) -> BinaryIO:
     - A QR code linking to Google Maps
     - Important information about medical needs and communication
     - Contact information for reporting sightings
-    
+
+    Results are memoized on the profile content, so regenerating a poster
+    for an unchanged profile returns the cached bytes.
+
     Args:
         profile_data: Dictionary containing the person's profile information
-        
+
     Returns:
-        BytesIO object containing the PDF poster, ready for downloading
-        
+        PDF poster as bytes, ready for downloading
+
     Raises:
         Exception: If there's an error during PDF generation
     """
-    logger.info(f"Creating missing person poster for {profile_data.get('name', 'unknown')}")
-    
-    # Create buffer for PDF output
-    pdf_buffer = io.BytesIO()
-    
+    logger.info("Creating missing person poster for %s", profile_data.get('name', 'unknown'))
+
     # Create poster using the custom MissingPersonPoster class
-    poster = MissingPersonPoster(profile_data)
+    poster = _get_poster_class()(profile_data)
     
     # === PAGE 1: MAIN INFORMATION ===
     poster.add_page()
@@ -299,15 +417,17 @@ def create_missing_person_poster(profile_data: Dict[str, Any]) -> BinaryIO:
     # --- Profile Image Section ---
     # Add profile image if available (centered near the top of the page)
     profile_image = profile_data.get('profile_image')
-    if profile_image and os.path.exists(profile_image):
+    if profile_image:
         try:
             # FPDF expects file paths as str objects, not bytes
             if isinstance(profile_image, bytes):
                 profile_image = profile_image.decode('utf-8')
             
             poster.image(profile_image, x=75, y=40, w=60, h=60)
+        except (FileNotFoundError, TypeError):
+            logger.warning("Profile image %s not available for poster", profile_image)
         except Exception as e:
-            logger.error(f"Error adding profile image to poster: {str(e)}")
+            logger.error("Error adding profile image to poster: %s", e)
     
     # --- Description Section ---
     # Add physical description details
@@ -316,14 +436,19 @@ def create_missing_person_poster(profile_data: Dict[str, Any]) -> BinaryIO:
     poster.cell(0, 10, 'DESCRIPTION:', 0, 1)
     poster.set_font('Arial', '', 12)
     
-    # Add each description element on its own line
-    poster.multi_cell(0, 8, f"Name: {profile_data.get('name', '')}")
-    poster.multi_cell(0, 8, f"Age: {profile_data.get('age', '')}")
-    poster.multi_cell(0, 8, f"Height: {profile_data.get('height', '')}")
-    poster.multi_cell(0, 8, f"Build: {profile_data.get('build', '')}")
-    poster.multi_cell(0, 8, f"Hair: {profile_data.get('hair', '')}")
-    poster.multi_cell(0, 8, f"Eyes: {profile_data.get('eyes', '')}")
-    poster.multi_cell(0, 8, f"Distinguishing features: {profile_data.get('distinguishing_features', '')}")
+    # Emit the whole description as one multi_cell; each call pays for
+    # font metrics and line-wrap measurement, so batching the lines
+    # amortizes that cost across the section
+    description_text = "\n".join((
+        f"Name: {profile_data.get('name', '')}",
+        f"Age: {profile_data.get('age', '')}",
+        f"Height: {profile_data.get('height', '')}",
+        f"Build: {profile_data.get('build', '')}",
+        f"Hair: {profile_data.get('hair', '')}",
+        f"Eyes: {profile_data.get('eyes', '')}",
+        f"Distinguishing features: {profile_data.get('distinguishing_features', '')}",
+    ))
+    poster.multi_cell(0, 8, description_text)
     
     # --- Last Seen Information Section ---
     poster.ln(10)  # Add some space
@@ -331,10 +456,13 @@ def create_missing_person_poster(profile_data: Dict[str, Any]) -> BinaryIO:
     poster.cell(0, 10, 'LAST SEEN:', 0, 1)
     poster.set_font('Arial', '', 12)
     
-    # Add when and where the person was last seen
-    poster.multi_cell(0, 8, f"Date and time: {profile_data.get('last_seen_datetime', 'Unknown')}")
-    poster.multi_cell(0, 8, f"Location: {profile_data.get('last_seen_location', 'Unknown')}")
-    poster.multi_cell(0, 8, f"Wearing: {profile_data.get('last_seen_wearing', 'Unknown')}")
+    # Add when and where the person was last seen, batched as one cell
+    last_seen_text = "\n".join((
+        f"Date and time: {profile_data.get('last_seen_datetime', 'Unknown')}",
+        f"Location: {profile_data.get('last_seen_location', 'Unknown')}",
+        f"Wearing: {profile_data.get('last_seen_wearing', 'Unknown')}",
+    ))
+    poster.multi_cell(0, 8, last_seen_text)
     
     # === PAGE 2: MAP AND LOCATION (OPTIONAL) ===
     # Try to add a map for the last seen location if possible
@@ -370,82 +498,67 @@ def create_missing_person_poster(profile_data: Dict[str, Any]) -> BinaryIO:
                 fill_opacity=0.1
             ).add_to(m)
             
-            # Save the map to a temporary HTML file (needed for folium)
-            with tempfile.NamedTemporaryFile(suffix='.html', delete=False) as tmp:
-                m.save(tmp.name)
-                
-                # Add a new page for the map information
-                poster.add_page()
-                poster.set_font('Arial', 'B', 14)
-                poster.cell(0, 10, 'LOCATION MAP', 0, 1, 'C')
+            # Save the map to this thread's scratch path (folium
+            # can only render to a file); overwritten on each poster
+            m.save(_scratch_path('map', '.html'))
+            
+            # Add a new page for the map information
+            poster.add_page()
+            poster.set_font('Arial', 'B', 14)
+            poster.cell(0, 10, 'LOCATION MAP', 0, 1, 'C')
+            poster.set_font('Arial', '', 12)
+            
+            # Add location details
+            poster.multi_cell(0, 8, f"Last seen at: {location_text}")
+            poster.multi_cell(0, 8, f"Coordinates: {lat:.6f}, {lng:.6f}")
+            poster.ln(10)
+            
+            # Add help text for using the digital options
+            poster.multi_cell(0, 8, "For an interactive map, scan the QR code or visit the URL below:")
+            
+            # Generate a Google Maps URL that opens at the specified location
+            google_maps_url = f"https://www.google.com/maps/search/?api=1&query={lat},{lng}"
+            poster.multi_cell(0, 8, google_maps_url)
+            
+            # Try to generate and add a QR code for the Google Maps link
+            try:
+                # Try to import qrcode library
+                import qrcode
+                import qrcode.image.pil
+                from PIL import Image
+                qrcode_available = True
+            except ImportError:
+                qrcode_available = False
+                logger.warning("QR code library not installed, skipping QR code generation")
+                # Add message to the PDF
+                poster.ln(5)
+                poster.set_font('Arial', 'I', 10)
+                poster.multi_cell(0, 8, "QR code generation not available. Please use the URL above.")
                 poster.set_font('Arial', '', 12)
                 
-                # Add location details
-                poster.multi_cell(0, 8, f"Last seen at: {location_text}")
-                poster.multi_cell(0, 8, f"Coordinates: {lat:.6f}, {lng:.6f}")
-                poster.ln(10)
-                
-                # Add help text for using the digital options
-                poster.multi_cell(0, 8, "For an interactive map, scan the QR code or visit the URL below:")
-                
-                # Generate a Google Maps URL that opens at the specified location
-                google_maps_url = f"https://www.google.com/maps/search/?api=1&query={lat},{lng}"
-                poster.multi_cell(0, 8, google_maps_url)
-                
-                # Try to generate and add a QR code for the Google Maps link
+            if qrcode_available:
                 try:
-                    # Try to import qrcode library
-                    import qrcode
-                    import qrcode.image.pil
-                    from PIL import Image
-                    qrcode_available = True
-                except ImportError:
-                    qrcode_available = False
-                    logger.warning("QR code library not installed, skipping QR code generation")
-                    # Add message to the PDF
+                    # Render (or reuse) the QR code PNG for this URL
+                    png_bytes = _qr_png_bytes(google_maps_url)
+
+                    # FPDF wants a file path, so spill the cached
+                    # bytes to this thread's scratch file
+                    qr_path = _scratch_path('qr', '.png')
+                    with open(qr_path, 'wb') as qr_file:
+                        qr_file.write(png_bytes)
+
+                    # Add the QR code to the PDF (centered)
+                    poster.image(qr_path, x=85, y=poster.get_y() + 10, w=40, h=40)
+                except Exception as e:
+                    logger.error("Error generating QR code: %s", e)
+                    # Add error message to the PDF
                     poster.ln(5)
                     poster.set_font('Arial', 'I', 10)
-                    poster.multi_cell(0, 8, "QR code generation not available. Please use the URL above.")
+                    poster.multi_cell(0, 8, "Error generating QR code. Please use the URL above.")
                     poster.set_font('Arial', '', 12)
-                    
-                if qrcode_available:
-                    try:
-                        # Generate QR code
-                        qr = qrcode.QRCode(
-                            version=1,
-                            error_correction=qrcode.constants.ERROR_CORRECT_L,
-                            box_size=10,
-                            border=4,
-                        )
-                        qr.add_data(google_maps_url)
-                        qr.make(fit=True)
-                        
-                        # Create an image from the QR Code
-                        img = qr.make_image(fill_color="black", back_color="white")
-                        
-                        # Save the QR code to a temporary file
-                        qr_temp = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
-                        img.save(qr_temp.name)
-                        qr_temp.close()
-                        
-                        # Add the QR code to the PDF (centered)
-                        poster.image(qr_temp.name, x=85, y=poster.get_y() + 10, w=40, h=40)
-                        
-                        # Clean up
-                        os.unlink(qr_temp.name)
-                    except Exception as e:
-                        logger.error(f"Error generating QR code: {str(e)}")
-                        # Add error message to the PDF
-                        poster.ln(5)
-                        poster.set_font('Arial', 'I', 10)
-                        poster.multi_cell(0, 8, "Error generating QR code. Please use the URL above.")
-                        poster.set_font('Arial', '', 12)
-                
-                # Clean up the temporary map file
-                tmp.close()
-                os.unlink(tmp.name)
+            
     except (ImportError, Exception) as e:
-        logger.warning(f"Could not add map to poster: {str(e)}")
+        logger.warning("Could not add map to poster: %s", e)
     
     # === PAGE 3: IMPORTANT INFORMATION ===
     poster.add_page()
@@ -453,10 +566,13 @@ def create_missing_person_poster(profile_data: Dict[str, Any]) -> BinaryIO:
     poster.cell(0, 10, 'IMPORTANT INFORMATION:', 0, 1)
     poster.set_font('Arial', '', 12)
     
-    # Add concise medical and communication information
-    poster.multi_cell(0, 8, f"Medical needs: {profile_data.get('medical_info_short', 'Unknown')}")
-    poster.multi_cell(0, 8, f"Communication: {profile_data.get('communication_short', 'Unknown')}")
-    poster.multi_cell(0, 8, f"Places they might go: {profile_data.get('places_might_go_short', 'Unknown')}")
+    # Add concise medical and communication information, batched as one cell
+    important_info_text = "\n".join((
+        f"Medical needs: {profile_data.get('medical_info_short', 'Unknown')}",
+        f"Communication: {profile_data.get('communication_short', 'Unknown')}",
+        f"Places they might go: {profile_data.get('places_might_go_short', 'Unknown')}",
+    ))
+    poster.multi_cell(0, 8, important_info_text)
     
     # --- Contact Information Section ---
     poster.ln(10)
@@ -466,20 +582,18 @@ def create_missing_person_poster(profile_data: Dict[str, Any]) -> BinaryIO:
     poster.cell(0, 8, 'Police: 101 or 999 in an emergency', 0, 1, 'C')
     poster.cell(0, 8, f"Reference: {profile_data.get('reference_number', 'Please quote name')}", 0, 1, 'C')
     
-    # Generate the final PDF and write to buffer
+    # Generate the final PDF bytes
     try:
         # Get PDF as bytes using the 'S' (string) output destination
         pdf_bytes = poster.output(dest='S')
-        
+
         # Handle string vs bytes output (FPDF inconsistency)
         if isinstance(pdf_bytes, str):
             pdf_bytes = pdf_bytes.encode('latin1')  # FPDF uses latin1 encoding
-            
-        # Write the bytes to our buffer
-        pdf_buffer.write(pdf_bytes)
-        logger.info(f"Missing person poster created successfully for {profile_data.get('name', 'unknown')}")
+
+        logger.info("Missing person poster created successfully for %s", profile_data.get('name', 'unknown'))
     except Exception as e:
-        logger.error(f"Error creating missing person poster: {str(e)}")
+        logger.error("Error creating missing person poster: %s", e)
         raise
-    
-    return pdf_buffer
+
+    return pdf_bytes
@@ -1,17 +1,34 @@
 """
 UI module for the Learning Disability Profile application.
 
-This package contains UI components for the application.
+This package contains UI components for the application. Components are
+imported lazily (PEP 562) so that importing one of them — typically the
+sidebar on app start — does not pull in the other form modules and their
+transitive dependencies.
 """
 
-from .sidebar import render_sidebar
-from .profile_form import render_profile_form
-from .missing_person_form import render_missing_person_form
-from .document_generator import render_document_generator
+import importlib
+
+# Map of public component name to the submodule that defines it
+_COMPONENTS = {
+    'render_sidebar': '.sidebar',
+    'render_profile_form': '.profile_form',
+    'render_missing_person_form': '.missing_person_form',
+    'render_document_generator': '.document_generator',
+}
 
 __all__ = [
-    'render_sidebar', 
-    'render_profile_form', 
-    'render_missing_person_form', 
+    'render_sidebar',
+    'render_profile_form',
+    'render_missing_person_form',
     'render_document_generator'
 ]
+
+
+def __getattr__(name):
+    """Resolve a UI component by importing its submodule on first access."""
+    try:
+        module_name = _COMPONENTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
@@ -9,15 +9,15 @@ Author: Adam Vials Moore
 License: Apache License 2.0
 """
 
-import os
 import datetime
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional, Tuple
 
 from config import ICONS
 from models import MISSING_PERSON_REQUIRED_FIELDS
-from utils import save_uploaded_image, generate_short_summary
-from database import get_database_manager
+from utils import save_uploaded_image, generate_short_summary, image_path_exists
+from database import get_database_manager, load_profile_cached
 
 # Try to import the geolocation component
 try:
@@ -27,6 +27,10 @@ except ImportError:
     GEOLOCATION_AVAILABLE = False
 
 
+# The page body runs as a fragment: widget interactions inside it rerun
+# only this function, not the whole script (sidebar, routing, CSS).
+# Reruns that must refresh the sidebar use st.rerun(scope="app").
+@st.fragment
 def render_missing_person_form() -> None:
     """
     Render the missing person information form.
@@ -54,16 +58,21 @@ def render_missing_person_form() -> None:
     # Load profile data
     db_manager = get_database_manager()
     try:
-        profile_data = db_manager.load_profile(current_profile_id)
+        profile_data = load_profile_cached(current_profile_id)
         if not profile_data:
             st.error(f"{ICONS['error']} Failed to load profile. It may have been deleted.")
             st.session_state.current_profile_id = None
-            st.rerun()
+            st.rerun(scope="app")
             return
     except Exception as e:
         st.error(f"{ICONS['error']} Error loading profile: {str(e)}")
         return
     
+    # Single timestamp for all of this render's date/time defaults; each
+    # datetime.now() is a clock syscall plus an allocation, and the form
+    # reruns on every widget interaction
+    now = datetime.datetime.now()
+
     st.write("## Missing Person Information")
     st.write(f"Updating information for: **{profile_data.get('name', '')}**")
     
@@ -80,7 +89,7 @@ def render_missing_person_form() -> None:
         
         with col2:
             # Display profile image if available
-            if profile_data.get('profile_image') and os.path.exists(profile_data.get('profile_image')):
+            if profile_data.get('profile_image') and image_path_exists(profile_data.get('profile_image')):
                 st.image(profile_data.get('profile_image'), width=150)
             else:
                 st.write("No profile image available")
@@ -96,7 +105,7 @@ def render_missing_person_form() -> None:
             # Date last seen field with appropriate default
             last_seen_date = st.date_input(
                 "Date Last Seen", 
-                value=datetime.datetime.now() if not profile_data.get('last_seen_date') else 
+                value=now if not profile_data.get('last_seen_date') else 
                       datetime.datetime.strptime(profile_data.get('last_seen_date'), '%Y-%m-%d').date(),
                 help="The date when the person was last seen"
             )
@@ -108,9 +117,9 @@ def render_missing_person_form() -> None:
                     time_parts = profile_data.get('last_seen_time').split(':')
                     default_time = datetime.time(int(time_parts[0]), int(time_parts[1]))
                 except (ValueError, IndexError):
-                    default_time = datetime.datetime.now().time()
+                    default_time = now.time()
             else:
-                default_time = datetime.datetime.now().time()
+                default_time = now.time()
             
             last_seen_time = st.time_input(
                 "Time Last Seen", 
@@ -206,7 +215,7 @@ def render_missing_person_form() -> None:
             
             # Display each photo in a column
             for i, photo_path in enumerate(existing_photos):
-                if os.path.exists(photo_path):
+                if image_path_exists(photo_path):
                     with cols[i % num_cols]:
                         try:
                             st.image(photo_path, width=150)
@@ -299,14 +308,18 @@ def render_missing_person_form() -> None:
             profile_data['communication_short'] = communication_short
             profile_data['places_might_go_short'] = places_might_go_short
             
-            # Save additional photos
+            # Save additional photos. The writes are I/O-bound, so a small
+            # thread pool overlaps the disk latency of each file instead of
+            # saving them one after another
             if additional_photos:
                 additional_image_paths = profile_data.get('additional_images', []) or []
-                for photo in additional_photos:
-                    image_path = save_uploaded_image(photo, profile_data['profile_id'], 'additional')
-                    if image_path:
-                        additional_image_paths.append(image_path)
-                
+                with ThreadPoolExecutor(max_workers=min(8, len(additional_photos))) as executor:
+                    saved_paths = executor.map(
+                        lambda photo: save_uploaded_image(photo, profile_data['profile_id'], 'additional'),
+                        additional_photos
+                    )
+                    additional_image_paths.extend(path for path in saved_paths if path)
+
                 profile_data['additional_images'] = additional_image_paths
             
             # Save updated profile to the database
@@ -315,7 +328,7 @@ def render_missing_person_form() -> None:
             
             # Show success message
             st.success(f"{ICONS['success']} Missing person information updated successfully!")
-            st.rerun()
+            st.rerun(scope="app")
         except Exception as e:
             # Handle any errors during saving
             st.error(f"{ICONS['error']} Error updating missing person information: {str(e)}")
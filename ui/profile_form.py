@@ -10,7 +10,6 @@ License: Apache License 2.0
 """
 
 import datetime
-import pandas as pd
 import streamlit as st
 from typing import Dict, Any, Optional, List
 
@@ -22,11 +21,23 @@ from config import (
 from models import Profile, PROFILE_REQUIRED_FIELDS
 from utils import (
     save_uploaded_image, calculate_age, format_height, format_weight,
-    format_contact_info
+    image_path_exists
 )
-from database import get_database_manager
+from database import get_database_manager, load_profile_cached
 
+# Option-value -> index lookup tables for the selectboxes, computed once
+# at import; a dict lookup replaces a membership test plus linear
+# list.index scan on every form rerun
+_RELATIONSHIP_IDX = {value: i for i, value in enumerate(RELATIONSHIP_OPTIONS)}
+_BUILD_IDX = {value: i for i, value in enumerate(BUILD_OPTIONS)}
+_HAIR_COLOR_IDX = {value: i for i, value in enumerate(HAIR_COLOR_OPTIONS)}
+_EYE_COLOR_IDX = {value: i for i, value in enumerate(EYE_COLOR_OPTIONS)}
 
+
+# The page body runs as a fragment: widget interactions inside it rerun
+# only this function, not the whole script (sidebar, routing, CSS).
+# Reruns that must refresh the sidebar use st.rerun(scope="app").
+@st.fragment
 def render_profile_form() -> None:
     """
     Render the profile creation/editing form.
@@ -57,11 +68,11 @@ def render_profile_form() -> None:
     
     if current_profile_id:
         try:
-            profile_data = db_manager.load_profile(current_profile_id)
+            profile_data = load_profile_cached(current_profile_id)
             if not profile_data:
                 st.error(f"{ICONS['error']} Failed to load profile. It may have been deleted.")
                 st.session_state.current_profile_id = None
-                st.rerun()
+                st.rerun(scope="app")
                 return
         except Exception as e:
             st.error(f"{ICONS['error']} Error loading profile: {str(e)}")
@@ -86,7 +97,7 @@ def render_profile_form() -> None:
             # Date of birth field with age calculation
             dob = st.date_input(
                 "Date of Birth", 
-                value=None if not profile_data.get('dob') else pd.to_datetime(profile_data.get('dob')),
+                value=None if not profile_data.get('dob') else datetime.date.fromisoformat(profile_data.get('dob')),
                 help="The person's date of birth"
             )
             
@@ -120,7 +131,7 @@ def render_profile_form() -> None:
             
             # Relationship dropdown with custom option
             selected_relationship = profile_data.get('emergency_contact_relationship', RELATIONSHIP_OPTIONS[0])
-            relationship_index = RELATIONSHIP_OPTIONS.index(selected_relationship) if selected_relationship in RELATIONSHIP_OPTIONS else 0
+            relationship_index = _RELATIONSHIP_IDX.get(selected_relationship, 0)
             
             relationship = st.selectbox(
                 "Relationship to Person", 
@@ -174,7 +185,7 @@ def render_profile_form() -> None:
             if profile_image_file:
                 st.image(profile_image_file, width=150)
                 st.caption("New profile photo to be uploaded")
-            elif profile_data.get('profile_image') and os.path.exists(profile_data.get('profile_image')):
+            elif profile_data.get('profile_image') and image_path_exists(profile_data.get('profile_image')):
                 try:
                     st.image(profile_data.get('profile_image'), width=150)
                     st.caption("Current profile photo")
@@ -214,7 +225,7 @@ def render_profile_form() -> None:
             
             # Build dropdown with custom option
             selected_build = profile_data.get('build', BUILD_OPTIONS[0])
-            build_index = BUILD_OPTIONS.index(selected_build) if selected_build in BUILD_OPTIONS else 0
+            build_index = _BUILD_IDX.get(selected_build, 0)
             
             build = st.selectbox(
                 "Build", 
@@ -233,7 +244,7 @@ def render_profile_form() -> None:
         with col2:
             # Hair color dropdown with custom option
             selected_hair_color = profile_data.get('hair_color', HAIR_COLOR_OPTIONS[0])
-            hair_color_index = HAIR_COLOR_OPTIONS.index(selected_hair_color) if selected_hair_color in HAIR_COLOR_OPTIONS else 0
+            hair_color_index = _HAIR_COLOR_IDX.get(selected_hair_color, 0)
             
             hair_color = st.selectbox(
                 "Hair Color", 
@@ -258,7 +269,7 @@ def render_profile_form() -> None:
             
             # Eye color dropdown with custom option
             selected_eye_color = profile_data.get('eye_color', EYE_COLOR_OPTIONS[0])
-            eye_color_index = EYE_COLOR_OPTIONS.index(selected_eye_color) if selected_eye_color in EYE_COLOR_OPTIONS else 0
+            eye_color_index = _EYE_COLOR_IDX.get(selected_eye_color, 0)
             
             eye_color = st.selectbox(
                 "Eye Color", 
@@ -434,7 +445,8 @@ def render_profile_form() -> None:
             # Show success message
             st.success(f"{ICONS['success']} Profile saved successfully!")
             
-            # Refresh the page to show the updated profile
-            st.rerun()
+            # Refresh the page (and the sidebar profile list) to show
+            # the updated profile
+            st.rerun(scope="app")
         except Exception as e:
             st.error(f"{ICONS['error']} Error saving profile: {str(e)}")
@@ -31,43 +31,51 @@ def render_sidebar() -> str:
     # Profile selection
     st.sidebar.header("Select Profile")
     
-    # Get all profiles from the database
-    try:
-        all_profiles = db_manager.get_all_profiles()
-    except Exception as e:
-        st.sidebar.error(f"{ICONS['error']} Error loading profiles: {str(e)}")
-        all_profiles = {}
-    
-    # Create options for the selectbox
-    profile_options = ["Create New Profile"] + list(all_profiles.keys())
-    profile_labels = ["Create New Profile"] + [
-        p.get('name', f"Profile {i}") for i, p in enumerate(all_profiles.values())
-    ]
-    
-    # Map display names to profile IDs
-    profile_map = dict(zip(profile_labels, profile_options))
-    
-    # Determine the current index
-    current_profile_id = st.session_state.get('current_profile_id')
-    current_index = 0
-    
-    if current_profile_id:
-        # Find the index of the current profile
-        for i, (label, profile_id) in enumerate(profile_map.items()):
-            if profile_id == current_profile_id:
-                current_index = i
-                break
-    
-    # Display the profile selection dropdown
-    selected_profile_label = st.sidebar.selectbox(
+    # Build the option lists and the id -> index reverse map, but only
+    # when the stored data has actually changed: the manager bumps
+    # data_version on every write, and the built lists are kept in
+    # session state so ordinary reruns skip both the profile query and
+    # the O(n) rebuild. Slot 0 is the "Create New Profile" entry; the
+    # reverse map replaces a per-rerun linear scan for the current index.
+    version = db_manager.data_version
+    cached = st.session_state.get('_profile_options')
+    if cached is not None and cached[0] == version:
+        _, profile_ids, profile_labels, id_to_index = cached
+    else:
+        # Get all profiles from the database
+        try:
+            all_profiles = db_manager.get_all_profiles()
+        except Exception as e:
+            st.sidebar.error(f"{ICONS['error']} Error loading profiles: {str(e)}")
+            all_profiles = {}
+
+        profile_ids = ["Create New Profile"]
+        profile_labels = ["Create New Profile"]
+        id_to_index = {}
+        for i, (profile_id, profile) in enumerate(all_profiles.items()):
+            profile_ids.append(profile_id)
+            profile_labels.append(profile.get('name', f"Profile {i}"))
+            id_to_index[profile_id] = i + 1
+
+        st.session_state['_profile_options'] = (version, profile_ids, profile_labels, id_to_index)
+
+    # Determine the current index with an O(1) lookup
+    current_index = id_to_index.get(st.session_state.get('current_profile_id'), 0)
+
+    # Display the profile selection dropdown. The options are positional
+    # indexes rendered through format_func, so the selection maps back to
+    # a profile ID without searching the label list (labels need not be
+    # unique either).
+    selected_index = st.sidebar.selectbox(
         "Select a profile",
-        options=profile_labels,
+        options=range(len(profile_labels)),
+        format_func=profile_labels.__getitem__,
         index=current_index,
         help="Choose an existing profile or create a new one"
     )
-    
+
     # Get the selected profile ID
-    selected_profile_id = profile_map[selected_profile_label]
+    selected_profile_id = profile_ids[selected_index]
     
     # Update the session state
     if selected_profile_id != "Create New Profile":
@@ -11,20 +11,39 @@ License: Apache License 2.0
 
 import os
 import uuid
+import shutil
 import datetime
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
 
 import streamlit as st
 from PIL import Image
 
-from config import PROFILE_DATA_DIR, IMAGES_DIR, MAP_SEARCH_RADIUS_METERS
+from config import PROFILE_DATA_DIR, IMAGES_DIR, MAP_SEARCH_RADIUS_METERS, MAP_DEFAULT_ZOOM
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Directories already created by this process; lets repeat uploads for
+# the same profile skip the mkdir syscall entirely
+_MADE_DIRS: set = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """
+    Create a directory once per process.
+
+    Args:
+        path: Directory to create (parents included)
+    """
+    key = str(path)
+    if key not in _MADE_DIRS:
+        path.mkdir(exist_ok=True, parents=True)
+        _MADE_DIRS.add(key)
+
 
 def save_uploaded_image(uploaded_file, profile_id: str, image_type: str) -> Optional[str]:
     """
@@ -44,24 +63,90 @@ def save_uploaded_image(uploaded_file, profile_id: str, image_type: str) -> Opti
     try:
         # Create directory for this profile if it doesn't exist
         profile_image_dir = IMAGES_DIR / profile_id
-        profile_image_dir.mkdir(exist_ok=True, parents=True)
+        _ensure_dir(profile_image_dir)
         
         # Generate unique filename
         file_extension = Path(uploaded_file.name).suffix.lower()
         filename = f"{image_type}_{uuid.uuid4()}{file_extension}"
         filepath = profile_image_dir / filename
         
-        # Save the file
+        # Save the file in 1 MB chunks so large uploads are streamed to
+        # disk instead of being materialized as one contiguous buffer
+        uploaded_file.seek(0)
         with open(filepath, "wb") as f:
-            f.write(uploaded_file.getbuffer())
-        
-        logger.info(f"Saved image {filename} for profile {profile_id}")
+            shutil.copyfileobj(uploaded_file, f, length=1024 * 1024)
+
+        # Downscale camera-resolution photos to the largest size any
+        # generated document uses, so PDF builds decode a small optimized
+        # image instead of re-scaling megapixel originals on every render
+        try:
+            with Image.open(filepath) as img:
+                if max(img.size) > 600:
+                    img.thumbnail((600, 600), Image.Resampling.LANCZOS)
+                    if file_extension in ('.jpg', '.jpeg'):
+                        img.save(filepath, optimize=True, quality=85)
+                    else:
+                        img.save(filepath, optimize=True)
+        except Exception as e:
+            logger.warning("Could not resize image %s: %s", filepath, e)
+
+        # Reset the existence and decode caches so later renders pick up
+        # the new file
+        image_path_exists.cache_clear()
+        load_image_cached.cache_clear()
+        logger.info("Saved image %s for profile %s", filename, profile_id)
         return str(filepath)
     except Exception as e:
-        logger.error(f"Error saving image: {str(e)}")
+        logger.error("Error saving image: %s", e)
         return None
 
 
+@lru_cache(maxsize=512)
+def image_path_exists(image_path: str) -> bool:
+    """
+    Memoized os.path.isfile for saved image paths.
+
+    Saved images are written once by save_uploaded_image and never
+    modified in place, so the existence check can be cached instead of
+    repeating a stat syscall on every Streamlit rerun. isfile is also
+    the stricter check — a directory at the path would be unusable
+    anyway. The cache is cleared when cleanup_old_files removes
+    anything.
+
+    Args:
+        image_path: Path to the image file
+
+    Returns:
+        True if the file exists and is a regular file
+    """
+    return os.path.isfile(image_path)
+
+
+@lru_cache(maxsize=32)
+def load_image_cached(image_path: str) -> Image.Image:
+    """
+    Load and fully decode an image, memoizing the result.
+
+    The PDF builders re-decode the profile photo on every generation;
+    since saved images are immutable once written (see
+    image_path_exists), the decoded PIL image can be cached and handed
+    to ReportLab directly, skipping the disk read and JPEG decode. The
+    cache is cleared alongside the existence cache.
+
+    Args:
+        image_path: Path to the image file
+
+    Returns:
+        Decoded PIL Image
+
+    Raises:
+        OSError: If the file cannot be read or decoded
+    """
+    img = Image.open(image_path)
+    img.load()
+    return img
+
+
 def get_image_dimensions(image_path: str) -> Tuple[int, int]:
     """
     Get the dimensions of an image.
@@ -76,7 +161,7 @@ def get_image_dimensions(image_path: str) -> Tuple[int, int]:
         with Image.open(image_path) as img:
             return img.size
     except Exception as e:
-        logger.error(f"Error getting image dimensions: {str(e)}")
+        logger.error("Error getting image dimensions: %s", e)
         return (0, 0)
 
 
@@ -238,9 +323,14 @@ def cleanup_old_files(max_age_days: int = 30) -> int:
                 if file_modified < cutoff_time:
                     os.remove(file_path)
                     count += 1
-                    logger.info(f"Deleted old file: {file_path}")
+                    logger.info("Deleted old file: %s", file_path)
     except Exception as e:
-        logger.error(f"Error cleaning up old files: {str(e)}")
+        logger.error("Error cleaning up old files: %s", e)
+    
+    # Deleted files may be cached as present; reset the path caches
+    if count:
+        image_path_exists.cache_clear()
+        load_image_cached.cache_clear()
     
     return count
 
@@ -304,18 +394,28 @@ def extract_coordinates(location_text: str) -> Tuple[Optional[float], Optional[f
             lat_str, lng_str = coords_part.split(',')
             return float(lat_str.strip()), float(lng_str.strip())
         except Exception as e:
-            logger.error(f"Error extracting coordinates from '{location_text}': {str(e)}")
+            logger.error("Error extracting coordinates from '%s': %s", location_text, e)
     
     return None, None
 
 
+# Successful geocode results by location text; the Nominatim round trip
+# is by far the slowest step in poster generation and care settings
+# reuse the same locations constantly. Failures are deliberately not
+# cached so transient network errors can recover.
+_GEOCODE_CACHE: Dict[str, Tuple[float, float]] = {}
+_GEOCODE_CACHE_MAX = 256
+
+
 def geocode_location(location_text: str) -> Tuple[Optional[float], Optional[float]]:
     """
     Geocode a location string to get coordinates.
     
     First attempts to extract coordinates from the text if present,
     then falls back to geocoding the location description using
-    the Nominatim geocoding service.
+    the Nominatim geocoding service. Successful lookups are cached
+    per process, so repeated posters for the same location skip the
+    network call.
     
     Args:
         location_text: Location description to geocode
@@ -323,6 +423,10 @@ def geocode_location(location_text: str) -> Tuple[Optional[float], Optional[floa
     Returns:
         Tuple of (latitude, longitude) or (None, None) if geocoding fails
     """
+    cached = _GEOCODE_CACHE.get(location_text)
+    if cached is not None:
+        return cached
+
     try:
         # First try to extract coordinates if they're already in the text
         lat, lng = extract_coordinates(location_text)
@@ -352,15 +456,18 @@ def geocode_location(location_text: str) -> Tuple[Optional[float], Optional[floa
             # Try to geocode
             location = geolocator.geocode(clean_location)
             if location:
+                if len(_GEOCODE_CACHE) >= _GEOCODE_CACHE_MAX:
+                    _GEOCODE_CACHE.clear()
+                _GEOCODE_CACHE[location_text] = (location.latitude, location.longitude)
                 return location.latitude, location.longitude
         except ImportError:
             logger.warning("Geopy not installed, cannot geocode location")
         except (GeocoderTimedOut, GeocoderUnavailable) as e:
-            logger.warning(f"Geocoding service timed out or unavailable: {str(e)}")
+            logger.warning("Geocoding service timed out or unavailable: %s", e)
         except Exception as e:
-            logger.error(f"Error geocoding location '{location_text}': {str(e)}")
+            logger.error("Error geocoding location '%s': %s", location_text, e)
     except Exception as e:
-        logger.error(f"Error geocoding: {str(e)}")
+        logger.error("Error geocoding: %s", e)
     
     return None, None
 
@@ -388,3 +495,35 @@ def generate_location_map(location_text: str, width: int = 800, height: int = 50
         except ImportError:
             logger.warning("Folium not installed, cannot generate map")
             return None
+
+        # Get coordinates for the location
+        lat, lng = geocode_location(location_text)
+        if lat is None or lng is None:
+            logger.warning("Could not geocode location '%s' for map", location_text)
+            return None
+
+        # Create a map centered at the coordinates
+        m = folium.Map(location=[lat, lng], zoom_start=MAP_DEFAULT_ZOOM, width=width, height=height)
+
+        # Add a marker at the exact location
+        folium.Marker(
+            [lat, lng],
+            popup=location_text,
+            tooltip="Last seen here",
+            icon=folium.Icon(color="red", icon="info-sign")
+        ).add_to(m)
+
+        # Add a circle to indicate the approximate search area
+        folium.Circle(
+            radius=MAP_SEARCH_RADIUS_METERS,
+            location=[lat, lng],
+            color="red",
+            fill=True,
+            fill_color="red",
+            fill_opacity=0.1
+        ).add_to(m)
+
+        return m.get_root().render()
+    except Exception as e:
+        logger.error("Error generating location map: %s", e)
+        return None